@@ -0,0 +1,228 @@
+"""Numba-accelerated kernels for the hot indicator loops in data_processor.
+
+Each kernel takes plain numpy arrays and fills its outputs in a single pass,
+avoiding the intermediate pandas Series the rolling/ewm chains allocate.
+When numba is not installed the callers fall back to the pandas
+implementations, so the decorator below only needs to be a no-op.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, error_model='numpy')
+def momentum_kernel(high, low, close):
+    """RSI, Stochastic %K/%D, Williams %R and ROC in one pass.
+
+    Matches the pandas formulation: simple 14-bar averages for RSI,
+    rolling 14-bar extremes for the oscillators, NaN until a full window
+    is available.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    stoch_k = np.full(n, np.nan)
+    stoch_d = np.full(n, np.nan)
+    williams_r = np.full(n, np.nan)
+    roc = np.full(n, np.nan)
+
+    # RSI: running sums of gains/losses over a 14-bar window
+    window = 14
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= window:
+            gain_sum -= gains[i - window]
+            loss_sum -= losses[i - window]
+        if i >= window - 1:
+            if loss_sum == 0.0:
+                rsi[i] = 100.0 if gain_sum > 0.0 else np.nan
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+
+    # Rolling 14-bar min/max via monotonic deques (O(1) amortized per bar)
+    min_idx = np.empty(n, np.int64)
+    max_idx = np.empty(n, np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+    for i in range(n):
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+        if i >= window - 1:
+            low_14 = low[min_idx[min_head]]
+            high_14 = high[max_idx[max_head]]
+            span = high_14 - low_14
+            stoch_k[i] = 100.0 * (close[i] - low_14) / span
+            williams_r[i] = -100.0 * (high_14 - close[i]) / span
+
+    # %D: 3-bar average of %K (NaN propagates through partial windows)
+    for i in range(2, n):
+        stoch_d[i] = (stoch_k[i] + stoch_k[i - 1] + stoch_k[i - 2]) / 3.0
+
+    # Rate of Change over 12 bars
+    for i in range(12, n):
+        prev = close[i - 12]
+        roc[i] = (close[i] - prev) / prev * 100.0
+
+    return rsi, stoch_k, stoch_d, williams_r, roc
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_min_max(low, high, window):
+    """Rolling min of low and max of high via monotonic deques.
+
+    O(1) amortized per bar versus pandas' O(window); NaN until a full
+    window is available, like rolling with the default min_periods.
+    """
+    n = low.shape[0]
+    out_min = np.full(n, np.nan)
+    out_max = np.full(n, np.nan)
+    min_idx = np.empty(n, np.int64)
+    max_idx = np.empty(n, np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+    for i in range(n):
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+        if i >= window - 1:
+            out_min[i] = low[min_idx[min_head]]
+            out_max[i] = high[max_idx[max_head]]
+    return out_min, out_max
+
+
+@njit(cache=True, error_model='numpy')
+def macd_kernel(close):
+    """MACD, signal line and histogram in a single pass over close.
+
+    Uses the numerator/denominator form of the adjusted EMA so the output
+    matches pandas ewm(span=..., adjust=True) bit-for-bit, while replacing
+    three separate ewm traversals with one loop.
+    """
+    n = close.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    histogram = np.empty(n)
+
+    decay_12 = 1.0 - 2.0 / 13.0
+    decay_26 = 1.0 - 2.0 / 27.0
+    decay_9 = 1.0 - 2.0 / 10.0
+    num_12 = den_12 = 0.0
+    num_26 = den_26 = 0.0
+    num_9 = den_9 = 0.0
+
+    for i in range(n):
+        x = close[i]
+        num_12 = x + decay_12 * num_12
+        den_12 = 1.0 + decay_12 * den_12
+        num_26 = x + decay_26 * num_26
+        den_26 = 1.0 + decay_26 * den_26
+        m = num_12 / den_12 - num_26 / den_26
+        num_9 = m + decay_9 * num_9
+        den_9 = 1.0 + decay_9 * den_9
+        s = num_9 / den_9
+        macd[i] = m
+        signal[i] = s
+        histogram[i] = m - s
+
+    return macd, signal, histogram
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_mean_std(values, window):
+    """Rolling mean and sample std from running sums in one pass.
+
+    NaN inputs are skipped and windows only produce output once fully
+    valid, matching pandas rolling with the default min_periods.
+    """
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for i in range(n):
+        v = values[i]
+        if not np.isnan(v):
+            total += v
+            total_sq += v * v
+            count += 1
+        if i >= window:
+            v_old = values[i - window]
+            if not np.isnan(v_old):
+                total -= v_old
+                total_sq -= v_old * v_old
+                count -= 1
+        if i >= window - 1 and count == window:
+            m = total / window
+            var = (total_sq - total * m) / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            mean[i] = m
+            std[i] = np.sqrt(var)
+    return mean, std
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_mad(values, window):
+    """Rolling mean absolute deviation, re-centered per window.
+
+    The window mean comes from a running sum; only the absolute-deviation
+    accumulation touches the window, so there is no per-row Python callback
+    like pandas rolling.apply incurs.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            mean = total / window
+            acc = 0.0
+            for j in range(i - window + 1, i + 1):
+                acc += abs(values[j] - mean)
+            out[i] = acc / window
+    return out